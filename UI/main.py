@@ -9,14 +9,17 @@ se tenían al mezclar la lógica en un solo archivo.
 
 from __future__ import annotations
 
+import importlib
 import os
 import sys
-from typing import Dict, Tuple
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QPalette, QFont
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QColor, QPalette
 from PySide6.QtWidgets import (
     QApplication,
+    QButtonGroup,
     QFrame,
     QHBoxLayout,
     QLabel,
@@ -32,41 +35,231 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from ViewModels.combinacion_lineal_vm import CombinacionLinealViewModel
-from ViewModels.matrix_equation_vm import MatrixEquationViewModel
-from ViewModels.resolucion_matriz_vm import MatrixCalculatorViewModel
-from ViewModels.vector_propiedades_vm import VectorPropiedadesViewModel
-from ViewModels.vector_dependencia_vm import VectorDependenciaViewModel
-
-from views.calculator_page import CalculatorPage
-from views.combination_page import CombinationPage
+# Solo la página de inicio se importa al arrancar; el resto de vistas y
+# ViewModels se importan dentro de las fábricas de página.
+from views.helpers import shared_font
 from views.home_page import HomePage
-from views.matrix_equation_page import MatrixEquationPage
-from views.mer_page import MerPage
-from views.vector_properties_page import VectorPropertiesPage
-from views.vector_dependence_page import VectorDependencePage
+
+# Módulos que las fábricas importan de forma diferida. Se precargan una vez
+# que la ventana ya está en pantalla para que la primera visita sea rápida.
+_DEFERRED_MODULES = (
+    "ViewModels.resolucion_matriz_vm",
+    "ViewModels.vector_propiedades_vm",
+    "ViewModels.combinacion_lineal_vm",
+    "ViewModels.matrix_equation_vm",
+    "ViewModels.vector_dependencia_vm",
+    "views.calculator_page",
+    "views.mer_page",
+    "views.vector_properties_page",
+    "views.combination_page",
+    "views.matrix_equation_page",
+    "views.vector_dependence_page",
+)
+
+
+# Colores del tema oscuro; se crean una sola vez al importar el módulo.
+_PALETTE_COLORS = {
+    QPalette.Window: QColor(10, 19, 43),
+    QPalette.WindowText: QColor(230, 239, 251),
+    QPalette.Base: QColor(18, 29, 61),
+    QPalette.AlternateBase: QColor(14, 24, 50),
+    QPalette.Text: QColor(230, 239, 251),
+    QPalette.Button: QColor(27, 44, 76),
+    QPalette.ButtonText: QColor(230, 239, 251),
+    QPalette.Highlight: QColor(64, 125, 188),
+    QPalette.HighlightedText: QColor(255, 255, 255),
+}
+
+
+@lru_cache(maxsize=1)
+def _build_palette() -> QPalette:
+    """Construye la paleta oscura a partir de los colores precalculados.
+
+    Se crea una sola vez por proceso; ``setPalette`` copia el valor, así que
+    compartir la instancia es seguro.
+    """
+
+    palette = QPalette()
+    for role, color in _PALETTE_COLORS.items():
+        palette.setColor(role, color)
+    return palette
+
+
+# Hoja de estilo del tema oscuro. ``run`` la instala una sola vez en la
+# ``QApplication``, de modo que Qt la analiza una vez para toda la app.
+DARK_STYLESHEET = """
+QWidget { font-size: 14px; }
+QLabel { color: #e6effb; }
+QLabel[role="pageTitle"] { font-size: 18px; font-weight: bold; }
+QLabel[role="note"] { font-size: 9pt; color: #9da5b4; }
+QLabel[role="summary"] { color: #cbd7ea; }
+QGroupBox {
+    border: 1px solid #2b4168;
+    border-radius: 8px;
+    padding: 10px;
+    margin-top: 10px;
+    background-color: #11284a;
+}
+QGroupBox:title {
+    subcontrol-origin: margin;
+    subcontrol-position: top left;
+    padding: 0 3px;
+}
+QSpinBox, QComboBox, QLineEdit {
+    background-color: #1c3156;
+    border: 1px solid #365a8e;
+    border-radius: 4px;
+    padding: 2px 4px;
+    color: #e6effb;
+    selection-background-color: #407dbc;
+    selection-color: #ffffff;
+}
+QPushButton {
+    background-color: #365a8e;
+    border: 1px solid #407dbc;
+    border-radius: 4px;
+    padding: 6px 14px;
+    color: #ffffff;
+}
+QPushButton:hover { background-color: #407dbc; }
+QPushButton:pressed { background-color: #2a4475; }
+QTableView {
+    background-color: #1c3156;
+    gridline-color: #2f4c77;
+    color: #e6effb;
+}
+QHeaderView::section {
+    background-color: #152b51;
+    color: #e6effb;
+    padding: 4px;
+    border: 1px solid #2b4168;
+    font-weight: bold;
+}
+QMessageBox {
+    background-color: #11284a;
+    color: #e6effb;
+    border: 1px solid #365a8e;
+}
+QMessageBox QLabel { color: #e6effb; }
+QMessageBox QPushButton {
+    background-color: #365a8e;
+    border: 1px solid #407dbc;
+    border-radius: 4px;
+    padding: 6px 12px;
+    color: #ffffff;
+}
+QMessageBox QPushButton:hover { background-color: #407dbc; }
+QMessageBox QPushButton:pressed { background-color: #2a4475; }
+#navPanel {
+    background-color: #11284a;
+    border-right: 1px solid #2b4168;
+}
+#navPanel[collapsed="true"] {
+    border-right: none;
+    background-color: #0d1c36;
+}
+#navToggleButton {
+    background-color: #243f6b;
+    border: 1px solid #365a8e;
+    border-radius: 6px;
+    padding: 6px 8px;
+    color: #e6effb;
+}
+#navToggleButton:hover { background-color: #2f5288; }
+#navToggleButton:pressed { background-color: #1b2f55; }
+#navTitle {
+    color: #ffffff;
+    padding-left: 6px;
+}
+#navButton {
+    background-color: transparent;
+    border: none;
+    color: #e6effb;
+    padding: 12px 16px;
+    text-align: left;
+    font-size: 13px;
+    border-radius: 6px;
+}
+#navButton:hover { background-color: #1c3156; }
+#navButton:checked {
+    background-color: #365a8e;
+    font-weight: bold;
+}
+QScrollArea { border: none; }
+QScrollArea > QWidget > QWidget { background-color: #1c3156; }
+"""
 
 
 class MatrixCalculatorWindow(QMainWindow):
     """Ventana principal que coordina navegación y ViewModels."""
 
+    # Texto de cada botón del menú lateral, indexado por la clave de página.
+    _NAV_LABELS: Dict[str, str] = {
+        "home": "Inicio",
+        "calculator": "Resolver",
+        "mer": "MER",
+        "vectors": "Propiedades ℝ^n",
+        "combination": "Combinación",
+        "matrix_eq": "AX = B",
+        "dependence": "Dependencia",
+    }
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("Calculadora de Matrices")
         self.resize(1200, 760)
 
-        self._create_view_models()
         self._build_ui()
         self._nav_collapsed = False
         self._apply_dark_theme()
+        QTimer.singleShot(0, self._prewarm_imports)
+
+    # ---------------------- Composición de páginas ----------------------
+    # Cada fábrica importa su vista y su ViewModel al invocarse; el ViewModel
+    # queda accesible como atributo de la ventana una vez creado.
+    def _create_calculator_page(self) -> QWidget:
+        from ViewModels.resolucion_matriz_vm import MatrixCalculatorViewModel
+        from views.calculator_page import CalculatorPage
 
-    # ---------------------- Composición de ViewModels ----------------------
-    def _create_view_models(self) -> None:
         self.calculator_vm = MatrixCalculatorViewModel()
+        return CalculatorPage(self.calculator_vm)
+
+    def _create_mer_page(self) -> QWidget:
+        from views.mer_page import MerPage
+
+        return MerPage()
+
+    def _create_vectors_page(self) -> QWidget:
+        from ViewModels.vector_propiedades_vm import VectorPropiedadesViewModel
+        from views.vector_properties_page import VectorPropertiesPage
+
         self.vector_vm = VectorPropiedadesViewModel()
+        return VectorPropertiesPage(self.vector_vm)
+
+    def _create_combination_page(self) -> QWidget:
+        from ViewModels.combinacion_lineal_vm import CombinacionLinealViewModel
+        from views.combination_page import CombinationPage
+
         self.combination_vm = CombinacionLinealViewModel()
+        return CombinationPage(self.combination_vm)
+
+    def _create_matrix_eq_page(self) -> QWidget:
+        from ViewModels.matrix_equation_vm import MatrixEquationViewModel
+        from views.matrix_equation_page import MatrixEquationPage
+
         self.matrix_eq_vm = MatrixEquationViewModel()
+        return MatrixEquationPage(self.matrix_eq_vm)
+
+    def _create_dependence_page(self) -> QWidget:
+        from ViewModels.vector_dependencia_vm import VectorDependenciaViewModel
+        from views.vector_dependence_page import VectorDependencePage
+
         self.dependence_vm = VectorDependenciaViewModel()
+        return VectorDependencePage(self.dependence_vm)
+
+    def _prewarm_imports(self) -> None:
+        for name in _DEFERRED_MODULES:
+            importlib.import_module(name)
 
     # ----------------------------- Configuración de UI -----------------------------
     def _build_ui(self) -> None:
@@ -83,7 +276,8 @@ class MatrixCalculatorWindow(QMainWindow):
         self.stack = QStackedWidget()
         root_layout.addWidget(self.stack, stretch=1)
 
-        self.pages: Dict[str, Tuple[QWidget, QPushButton]] = {}
+        # clave -> (página o None si aún no se construye, botón, fábrica)
+        self.pages: Dict[str, Tuple[Optional[QWidget], QPushButton, Callable[[], QWidget]]] = {}
         self._register_pages()
 
         # Seleccionar la página de inicio por defecto
@@ -93,6 +287,7 @@ class MatrixCalculatorWindow(QMainWindow):
         panel = QFrame()
         panel.setObjectName("navPanel")
         panel.setProperty("collapsed", False)
+        panel.setAttribute(Qt.WA_StyledBackground, True)
         panel.setFixedWidth(200)
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(8, 12, 8, 12)
@@ -111,16 +306,17 @@ class MatrixCalculatorWindow(QMainWindow):
 
         title = QLabel("Calculadora")
         title.setObjectName("navTitle")
-        font = QFont()
-        font.setPointSize(14)
-        font.setBold(True)
-        title.setFont(font)
+        title.setFont(shared_font(14, bold=True))
         title.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
         self._nav_title_label = title
         top_bar.addWidget(title, 1)
         layout.addLayout(top_bar)
 
         self.nav_buttons: Dict[str, QPushButton] = {}
+        # El grupo mantiene la selección exclusiva de los botones en C++.
+        self._nav_group = QButtonGroup(panel)
+        self._nav_group.setExclusive(True)
+        self._nav_button_widgets: List[QPushButton] = []
         self._nav_buttons_layout = QVBoxLayout()
         self._nav_buttons_layout.setContentsMargins(0, 8, 0, 0)
         self._nav_buttons_layout.setSpacing(6)
@@ -134,177 +330,89 @@ class MatrixCalculatorWindow(QMainWindow):
         button.setObjectName("navButton")
         button.setCursor(Qt.PointingHandCursor)
         button.setCheckable(True)
-        button.setAutoExclusive(True)
-        button.clicked.connect(lambda: self._on_nav_clicked(key, index))
+        self._nav_group.addButton(button, index)
+        button.clicked.connect(partial(self._on_nav_clicked, key, index))
         self.nav_buttons[key] = button
+        self._nav_button_widgets.append(button)
         self._nav_buttons_layout.addWidget(button)
         return button
 
     def _register_pages(self) -> None:
-        pages = [
-            ("home", "Inicio", HomePage()),
-            ("calculator", "Resolver", CalculatorPage(self.calculator_vm)),
-            ("mer", "MER", MerPage()),
-            ("vectors", "Propiedades ℝ^n", VectorPropertiesPage(self.vector_vm)),
-            ("combination", "Combinación", CombinationPage(self.combination_vm)),
-            ("matrix_eq", "AX = B", MatrixEquationPage(self.matrix_eq_vm)),
-            ("dependence", "Dependencia", VectorDependencePage(self.dependence_vm)),
+        # Solo la página de inicio se construye de inmediato; el resto se
+        # crea la primera vez que se visita (ver ``_ensure_page``).
+        pages: List[Tuple[str, Callable[[], QWidget]]] = [
+            ("home", HomePage),
+            ("calculator", self._create_calculator_page),
+            ("mer", self._create_mer_page),
+            ("vectors", self._create_vectors_page),
+            ("combination", self._create_combination_page),
+            ("matrix_eq", self._create_matrix_eq_page),
+            ("dependence", self._create_dependence_page),
         ]
 
-        for index, (key, label, widget) in enumerate(pages):
-            button = self._create_nav_button(key, label, index)
-            self.stack.addWidget(widget)
-            self.pages[key] = (widget, button)
+        for index, (key, factory) in enumerate(pages):
+            button = self._create_nav_button(key, self._NAV_LABELS[key], index)
+            widget = factory() if key == "home" else None
+            # Las páginas diferidas ocupan su índice con un marcador ligero.
+            self.stack.addWidget(widget if widget is not None else QWidget())
+            self.pages[key] = (widget, button, factory)
 
         self._nav_buttons_layout.addStretch(1)
 
+    def _ensure_page(self, key: str) -> QWidget:
+        """Devuelve la página ``key``, construyéndola en la primera visita."""
+
+        widget, button, factory = self.pages[key]
+        if widget is not None:
+            return widget
+
+        widget = factory()
+        # El id del botón en el grupo es el índice de la página en la pila.
+        index = self._nav_group.id(button)
+        placeholder = self.stack.widget(index)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.stack.insertWidget(index, widget)
+        self.pages[key] = (widget, button, factory)
+        return widget
+
     # ----------------------------- Navegación ---------------------------
     def _on_nav_clicked(self, key: str, index: int) -> None:
+        self._ensure_page(key)
         self.stack.setCurrentIndex(index)
-        for name, (_, button) in self.pages.items():
-            button.setChecked(name == key)
 
     def _set_current_page(self, key: str) -> None:
-        widget, button = self.pages[key]
-        index = self.stack.indexOf(widget)
-        self.stack.setCurrentIndex(index)
-        button.setChecked(True)
+        self.stack.setCurrentWidget(self._ensure_page(key))
+        self.pages[key][1].setChecked(True)
 
     def _toggle_nav_panel(self) -> None:
         self._nav_collapsed = not self._nav_collapsed
-        if self._nav_collapsed:
-            self.nav_panel.setFixedWidth(64)
-            self._nav_title_label.setVisible(False)
-            for button in self.nav_buttons.values():
-                button.setVisible(False)
-        else:
-            self.nav_panel.setFixedWidth(200)
-            self._nav_title_label.setVisible(True)
-            for button in self.nav_buttons.values():
-                button.setVisible(True)
-
-        self.nav_panel.setProperty("collapsed", self._nav_collapsed)
-        self.nav_panel.style().unpolish(self.nav_panel)
-        self.nav_panel.style().polish(self.nav_panel)
+        # Se congela el panel para que ancho, visibilidad y estilo se
+        # apliquen en un único repintado.
+        self.nav_panel.setUpdatesEnabled(False)
+        try:
+            visible = not self._nav_collapsed
+            self.nav_panel.setFixedWidth(200 if visible else 64)
+            self._nav_title_label.setVisible(visible)
+            for button in self._nav_button_widgets:
+                button.setVisible(visible)
+
+            # Cada llamada invierte ``collapsed``; un solo ``polish`` (sin
+            # ``unpolish``) basta para reevaluar el selector ``[collapsed=...]``.
+            self.nav_panel.setProperty("collapsed", self._nav_collapsed)
+            self.nav_panel.style().polish(self.nav_panel)
+        finally:
+            self.nav_panel.setUpdatesEnabled(True)
 
     # ------------------------------ Estilos ------------------------------
     def _apply_dark_theme(self) -> None:
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(10, 19, 43))
-        palette.setColor(QPalette.WindowText, QColor(230, 239, 251))
-        palette.setColor(QPalette.Base, QColor(18, 29, 61))
-        palette.setColor(QPalette.AlternateBase, QColor(14, 24, 50))
-        palette.setColor(QPalette.Text, QColor(230, 239, 251))
-        palette.setColor(QPalette.Button, QColor(27, 44, 76))
-        palette.setColor(QPalette.ButtonText, QColor(230, 239, 251))
-        palette.setColor(QPalette.Highlight, QColor(64, 125, 188))
-        palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-        self.setPalette(palette)
-
-        self.setStyleSheet(
-            """
-            QWidget { font-size: 14px; }
-            QLabel { color: #e6effb; }
-            QGroupBox {
-                border: 1px solid #2b4168;
-                border-radius: 8px;
-                padding: 10px;
-                margin-top: 10px;
-                background-color: #11284a;
-            }
-            QGroupBox:title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 3px;
-            }
-            QSpinBox, QComboBox, QLineEdit {
-                background-color: #1c3156;
-                border: 1px solid #365a8e;
-                border-radius: 4px;
-                padding: 2px 4px;
-                color: #e6effb;
-                selection-background-color: #407dbc;
-                selection-color: #ffffff;
-            }
-            QPushButton {
-                background-color: #365a8e;
-                border: 1px solid #407dbc;
-                border-radius: 4px;
-                padding: 6px 14px;
-                color: #ffffff;
-            }
-            QPushButton:hover { background-color: #407dbc; }
-            QPushButton:pressed { background-color: #2a4475; }
-            QTableWidget {
-                background-color: #1c3156;
-                gridline-color: #2f4c77;
-                color: #e6effb;
-            }
-            QHeaderView::section {
-                background-color: #152b51;
-                color: #e6effb;
-                padding: 4px;
-                border: 1px solid #2b4168;
-                font-weight: bold;
-            }
-            QMessageBox {
-                background-color: #11284a;
-                color: #e6effb;
-                border: 1px solid #365a8e;
-            }
-            QMessageBox QLabel { color: #e6effb; }
-            QMessageBox QPushButton {
-                background-color: #365a8e;
-                border: 1px solid #407dbc;
-                border-radius: 4px;
-                padding: 6px 12px;
-                color: #ffffff;
-            }
-            QMessageBox QPushButton:hover { background-color: #407dbc; }
-            QMessageBox QPushButton:pressed { background-color: #2a4475; }
-            #navPanel {
-                background-color: #11284a;
-                border-right: 1px solid #2b4168;
-            }
-            #navPanel[collapsed="true"] {
-                border-right: none;
-                background-color: #0d1c36;
-            }
-            #navToggleButton {
-                background-color: #243f6b;
-                border: 1px solid #365a8e;
-                border-radius: 6px;
-                padding: 6px 8px;
-                color: #e6effb;
-            }
-            #navToggleButton:hover { background-color: #2f5288; }
-            #navToggleButton:pressed { background-color: #1b2f55; }
-            #navTitle {
-                color: #ffffff;
-                padding-left: 6px;
-            }
-            #navButton {
-                background-color: transparent;
-                border: none;
-                color: #e6effb;
-                padding: 12px 16px;
-                text-align: left;
-                font-size: 13px;
-                border-radius: 6px;
-            }
-            #navButton:hover { background-color: #1c3156; }
-            #navButton:checked {
-                background-color: #365a8e;
-                font-weight: bold;
-            }
-            QScrollArea { border: none; }
-            QScrollArea > QWidget > QWidget { background-color: #1c3156; }
-            """
-        )
+        # La hoja de estilo se aplica a nivel de aplicación en ``run``.
+        self.setPalette(_build_palette())
 
 
 def run() -> None:
     app = QApplication(sys.argv)
+    app.setStyleSheet(DARK_STYLESHEET)
     window = MatrixCalculatorWindow()
     window.show()
     sys.exit(app.exec())
@@ -13,7 +13,6 @@ from __future__ import annotations
 from typing import List, Sequence
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QFrame,
     QGridLayout,
@@ -27,8 +26,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QScrollArea,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QSizePolicy,
@@ -37,6 +35,18 @@ from PySide6.QtWidgets import (
 from ViewModels.resolucion_matriz_vm import MatrixCalculatorViewModel, ResultVM, StepVM
 
 from . import dialogs, helpers
+from .table_models import MatrixTableModel
+
+
+def _set_visible(widget: QWidget, visible: bool) -> None:
+    """Cambia la visibilidad solo si difiere del estado explícito actual.
+
+    Se consulta ``isHidden`` (y no ``isVisible``) para que el resultado no
+    dependa de si la página está en pantalla.
+    """
+
+    if widget.isHidden() == visible:
+        widget.setVisible(visible)
 
 
 class CalculatorPage(QWidget):
@@ -46,7 +56,9 @@ class CalculatorPage(QWidget):
     MAX_ROWS = 10
     MIN_COLS = 3
     MAX_COLS = 12
+    # Pasos que el diálogo carga en cada lote al desplazarse.
     MAX_DISPLAY_STEPS = 10
+    ROW_HEIGHT = 24
 
     def __init__(self, view_model: MatrixCalculatorViewModel, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -54,6 +66,15 @@ class CalculatorPage(QWidget):
         self._last_steps: List[StepVM] | None = None
         self._last_pivot_cols: List[int] | None = None
         self._last_free_vars: List[int] | None = None
+        # Último texto escrito en las etiquetas de resumen; evita ``setText``
+        # (y el relayout asociado) cuando el resultado no cambia.
+        self._last_piv_text: str | None = None
+        self._last_consistency_text: str | None = None
+        # Etiquetas reutilizables de ``solution_container``; solo se crean
+        # nuevas cuando el resultado tiene más líneas que las ya existentes.
+        self._solution_labels: List[QLabel] = []
+        self._solve_cache = helpers.ResultCache()
+
 
         self._build_ui()
         self._wire_events()
@@ -69,13 +90,13 @@ class CalculatorPage(QWidget):
         self._config_panel = self._build_config_panel()
         layout.addWidget(self._config_panel, stretch=1)
 
-        result_panel = self._build_result_panel()
+        self._result_panel = self._build_result_panel()
         result_scroll = QScrollArea()
         result_scroll.setWidgetResizable(True)
         result_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         result_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         result_scroll.setFrameShape(QFrame.NoFrame)
-        result_scroll.setWidget(result_panel)
+        result_scroll.setWidget(self._result_panel)
         layout.addWidget(result_scroll, stretch=3)
 
     def _build_config_panel(self) -> QWidget:
@@ -101,7 +122,7 @@ class CalculatorPage(QWidget):
         self.rows_spin.setValue(self.view_model.rows)
         grid.addWidget(self.rows_spin, 0, 1)
         rows_note = QLabel("2–10 filas")
-        rows_note.setStyleSheet("font-size: 9pt; color: #9da5b4;")
+        rows_note.setProperty("role", "note")
         grid.addWidget(rows_note, 1, 0, 1, 2)
 
         # Columnas (variables)
@@ -111,7 +132,7 @@ class CalculatorPage(QWidget):
         self.cols_spin.setValue(self.view_model.cols)
         grid.addWidget(self.cols_spin, 2, 1)
         cols_note = QLabel("3–12 columnas")
-        cols_note.setStyleSheet("font-size: 9pt; color: #9da5b4;")
+        cols_note.setProperty("role", "note")
         grid.addWidget(cols_note, 3, 0, 1, 2)
 
         # Método (placeholder por si se añaden más métodos)
@@ -123,10 +144,7 @@ class CalculatorPage(QWidget):
         grid.addWidget(QLabel("Resolución por pivoteo parcial."), 5, 0, 1, 2)
 
         self.dimension_label = QLabel()
-        font_dim = QFont()
-        font_dim.setPointSize(9)
-        font_dim.setItalic(True)
-        self.dimension_label.setFont(font_dim)
+        self.dimension_label.setFont(helpers.shared_font(9, italic=True))
         grid.addWidget(self.dimension_label, 6, 0, 1, 2)
 
         button_row = QHBoxLayout()
@@ -146,58 +164,47 @@ class CalculatorPage(QWidget):
         layout.setSpacing(2)
 
         title = QLabel("Matriz aumentada del sistema")
-        font_title = QFont()
-        font_title.setPointSize(14)
-        font_title.setBold(True)
-        title.setFont(font_title)
+        title.setFont(helpers.shared_font(14, bold=True))
         layout.addWidget(title)
 
-        self.table = QTableWidget()
+        self.table_model = MatrixTableModel(parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.table.setSizeAdjustPolicy(QTableWidget.AdjustToContents)
+        self.table.setSizeAdjustPolicy(QAbstractItemView.AdjustToContents)
         self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.table.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.table.setMinimumHeight(260)
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.Stretch)
-        header.setSectionsClickable(True)
+        helpers.use_interactive_columns(self.table)
+        # Filas de alto fijo: Qt no recalcula alturas al redimensionar.
+        self.table.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         layout.addWidget(self.table, stretch=2)
 
         layout.addWidget(self._make_separator())
 
         solution_title = QLabel("Resultado")
-        font_solution = QFont()
-        font_solution.setPointSize(13)
-        font_solution.setBold(True)
-        solution_title.setFont(font_solution)
+        solution_title.setFont(helpers.shared_font(13, bold=True))
         layout.addWidget(solution_title)
 
         self.state_label = QLabel()
-        font_state = QFont()
-        font_state.setPointSize(11)
-        font_state.setBold(True)
-        self.state_label.setFont(font_state)
+        self.state_label.setFont(helpers.shared_font(11, bold=True))
         layout.addWidget(self.state_label)
 
         self.consistency_label = QLabel()
-        self.consistency_label.setStyleSheet("color: #cbd7ea;")
+        self.consistency_label.setProperty("role", "summary")
         layout.addWidget(self.consistency_label)
 
         self.pivots_label = QLabel()
-        self.pivots_label.setStyleSheet("color: #cbd7ea; margin-bottom: 2px;")
+        self.pivots_label.setProperty("role", "summary")
         layout.addWidget(self.pivots_label)
 
-        self.solution_widget = QWidget()
-        self.solution_container = QVBoxLayout(self.solution_widget)
-        self.solution_container.setContentsMargins(0, 0, 0, 0)
-        self.solution_container.setSpacing(2)
-
         self.solution_scroll = QScrollArea()
         self.solution_scroll.setWidgetResizable(True)
         self.solution_scroll.setMinimumHeight(240)
-        self.solution_scroll.setWidget(self.solution_widget)
+        self._install_solution_widget()
         layout.addWidget(self.solution_scroll, stretch=3)
 
         self.btn_show_steps = QPushButton("Ver pasos Gauss–Jordan")
@@ -215,8 +222,11 @@ class CalculatorPage(QWidget):
 
     # ----------------------------- Conexiones -----------------------------
     def _wire_events(self) -> None:
-        self.rows_spin.valueChanged.connect(self._on_dimensions_changed)
-        self.cols_spin.valueChanged.connect(self._on_dimensions_changed)
+        # Cada tic de los spin boxes solo reinicia el temporizador; la tabla
+        # se redimensiona una vez con los valores finales.
+        self._flush_pending_resize = helpers.debounce_spin_boxes(
+            self, (self.rows_spin, self.cols_spin), self._on_dimensions_changed
+        )
         self.solve_button.clicked.connect(self._on_solve_clicked)
         self.clear_button.clicked.connect(self._on_clear_clicked)
         self.example_button.clicked.connect(self._on_example_clicked)
@@ -232,88 +242,121 @@ class CalculatorPage(QWidget):
         self.dimension_label.setText(f"Matriz {m}×{n} (A|b)")
 
     def _on_solve_clicked(self) -> None:
+        self._flush_pending_resize()
         try:
-            augmented = helpers.table_to_matrix(self.table)
-            result = self.view_model.solve(augmented)
+            augmented = self.table_model.to_matrix()
+            key = helpers.matrix_key(augmented)
+            result = self._solve_cache.get(key)
+            if result is None:
+                result = self.view_model.solve(augmented)
+                self._solve_cache.put(key, result)
             self._update_result_display(result)
         except Exception as exc:
             QMessageBox.critical(self, "Error", str(exc))
 
     def _on_clear_clicked(self) -> None:
-        helpers.fill_table_with_zero(self.table)
+        self.table_model.fill()
         self.state_label.clear()
         self.consistency_label.clear()
         self.pivots_label.clear()
+        self._last_consistency_text = None
+        self._last_piv_text = None
         self._clear_solution_display()
         self._last_steps = None
-        self.btn_show_steps.setVisible(False)
+        _set_visible(self.btn_show_steps, False)
 
     def _on_example_clicked(self) -> None:
+        self._flush_pending_resize()
         m = self.rows_spin.value()
         n = self.cols_spin.value()
-        for i in range(m):
-            for j in range(n):
-                value = 1.0 if i == j else float((i + j) % 5 + 1)
-                item = QTableWidgetItem(f"{value}")
-                item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(i, j, item)
-            b_value = float(i + 1)
-            b_item = QTableWidgetItem(f"{b_value}")
-            b_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(i, n, b_item)
+        cells = [
+            [f"{1.0 if i == j else float((i + j) % 5 + 1)}" for j in range(n)] + [f"{float(i + 1)}"]
+            for i in range(m)
+        ]
+        self.table_model.set_cells(cells)
 
     def _handle_show_steps(self) -> None:
         if not self._last_steps:
             return
-        dialogs.show_steps_dialog(self, self._last_steps, self._last_pivot_cols or [])
+        dialogs.show_steps_dialog(
+            self,
+            self._last_steps,
+            self._last_pivot_cols or [],
+            batch_size=self.MAX_DISPLAY_STEPS,
+        )
 
     # --------------------------- Actualización de la vista ----------------------------
     def _update_table_dimensions(self) -> None:
         rows = self.view_model.rows
         cols = self.view_model.cols + 1
-        self.table.setRowCount(rows)
-        self.table.setColumnCount(cols)
-        self.table.setHorizontalHeaderLabels([f"x{j + 1}" for j in range(cols - 1)] + ["b"])
-        helpers.ensure_table_defaults(self.table)
+        self.table_model.resize(rows, cols, helpers.column_labels("x", cols - 1) + ("b",))
 
     def _update_result_display(self, result: ResultVM) -> None:
         self._last_steps = result.steps
         self._last_pivot_cols = result.pivot_cols or []
         self._last_free_vars = result.free_vars or []
 
-        self.state_label.setText(helpers.status_to_text(result.status))
-        is_consistent = result.status in ("UNICA", "INFINITAS")
-        self.consistency_label.setText("Sistema: Consistente" if is_consistent else "Sistema: Inconsistente")
+        # Todas las escrituras se agrupan en un solo repintado del panel.
+        self._result_panel.setUpdatesEnabled(False)
+        try:
+            self.state_label.setText(helpers.status_to_text(result.status))
+            is_consistent = result.status in ("UNICA", "INFINITAS")
+            consistency_text = "Sistema: Consistente" if is_consistent else "Sistema: Inconsistente"
+            if consistency_text != self._last_consistency_text:
+                self.consistency_label.setText(consistency_text)
+                self._last_consistency_text = consistency_text
 
-        piv_text = ", ".join([f"x{j + 1}" for j in (self._last_pivot_cols or [])]) or "—"
-        self.pivots_label.setText(f"Columnas pivote: {piv_text}")
+            piv_text = helpers.format_pivot_cols(tuple(self._last_pivot_cols))
+            new_text = f"Columnas pivote: {piv_text}"
+            if new_text != self._last_piv_text:
+                self.pivots_label.setText(new_text)
+                self._last_piv_text = new_text
 
-        self._clear_solution_display()
-        labels = [f"x{idx + 1}" for idx in range(self.view_model.cols)]
-        for line in helpers.format_result_lines(result, labels):
-            label = QLabel(line)
+            labels = helpers.column_labels("x", self.view_model.cols)
+            self._show_solution_lines(helpers.format_result_lines(result, labels))
+
+            _set_visible(self.btn_show_steps, bool(result.steps))
+        finally:
+            self._result_panel.setUpdatesEnabled(True)
+
+    def _install_solution_widget(self) -> None:
+        """Coloca en ``solution_scroll`` un contenedor vacío para las líneas del resultado."""
+
+        self.solution_widget = QWidget()
+        self.solution_container = QVBoxLayout(self.solution_widget)
+        self.solution_container.setContentsMargins(0, 0, 0, 0)
+        self.solution_container.setSpacing(2)
+        self.solution_scroll.setWidget(self.solution_widget)
+
+    def _show_solution_lines(self, lines: List[str]) -> None:
+        """Escribe ``lines`` en el pool de etiquetas y oculta las sobrantes."""
+
+        while len(self._solution_labels) < len(lines):
+            label = QLabel()
             label.setWordWrap(True)
             self.solution_container.addWidget(label)
+            self._solution_labels.append(label)
 
-        if result.steps:
-            self.btn_show_steps.setVisible(True)
-        else:
-            self.btn_show_steps.setVisible(False)
+        for label, line in zip(self._solution_labels, lines):
+            if label.text() != line:
+                label.setText(line)
+            _set_visible(label, True)
+        for label in self._solution_labels[len(lines):]:
+            _set_visible(label, False)
 
     def _clear_solution_display(self) -> None:
-        while self.solution_container.count():
-            item = self.solution_container.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        # Las etiquetas se conservan ocultas para el próximo resultado.
+        self._show_solution_lines([])
 
     # ----------------------------- Utilidades -----------------------------
     def export_state(self) -> dict:
         """Expose a snapshot for debugging or future persistence."""
 
+        self._flush_pending_resize()
+
         return {
             "rows": self.view_model.rows,
             "cols": self.view_model.cols,
-            "augmented": helpers.table_to_matrix(self.table),
+            "augmented": self.table_model.to_matrix(),
             "last_steps": self._last_steps,
         }
@@ -8,20 +8,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from fractions import Fraction
-from typing import List, Optional
+from itertools import chain
+from typing import List, Optional, Tuple
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QGroupBox,
-    QHeaderView,
     QHBoxLayout,
     QLabel,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSpinBox,
-    QTableWidget,
-    QTextEdit,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -30,6 +30,7 @@ from ViewModels.combinacion_lineal_vm import CombinacionLinealViewModel, Combina
 
 from . import dialogs, helpers
 from .components import AlertBanner
+from .table_models import MatrixTableModel
 
 
 @dataclass
@@ -37,9 +38,47 @@ class _StoredResult:
     explanation: CombinationResultVM
 
 
+class _SolveSignals(QObject):
+    """Señales de ``_SolveTask``; llegan al hilo de la GUI en cola."""
+
+    finished = Signal(int, object, str)
+    failed = Signal(int, str)
+
+
+class _SolveTask(QRunnable):
+    """Resuelve la combinación y arma el informe fuera del hilo de la GUI."""
+
+    def __init__(
+        self,
+        ticket: int,
+        view_model: CombinacionLinealViewModel,
+        generadores: List[List[Fraction]],
+        objetivo: List[Fraction],
+        signals: _SolveSignals,
+    ) -> None:
+        super().__init__()
+        self._ticket = ticket
+        self._vm = view_model
+        self._generadores = generadores
+        self._objetivo = objetivo
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            resultado = self._vm.analizar(self._generadores, self._objetivo)
+            text = CombinationPage._build_report(resultado, self._generadores, self._objetivo)
+        except Exception as exc:
+            self._signals.failed.emit(self._ticket, str(exc))
+        else:
+            self._signals.finished.emit(self._ticket, resultado, text)
+
+
 class CombinationPage(QWidget):
     """Analiza si b pertenece al subespacio generado por {v1,...,vk}."""
 
+    # Tamaño de lote de ``dialogs.show_steps_dialog`` para esta página.
+    MAX_DISPLAY_STEPS = 10
+
     def __init__(
         self,
         view_model: CombinacionLinealViewModel,
@@ -52,6 +91,16 @@ class CombinationPage(QWidget):
         self._max_rows = max_rows
         self._max_cols = max_cols
         self._last_result: Optional[_StoredResult] = None
+        # Cada análisis lleva un número; las respuestas de análisis anteriores
+        # (p. ej. tras "Limpiar") se descartan al llegar.
+        self._solve_ticket = 0
+        # Resultados ya calculados: (resultado, texto) por (generadores, objetivo).
+        self._solve_cache = helpers.ResultCache()
+        self._pending_key: Optional[Tuple] = None
+        self._solve_running = False
+        self._solve_signals = _SolveSignals(self)
+        self._solve_signals.finished.connect(self._on_solve_finished)
+        self._solve_signals.failed.connect(self._on_solve_failed)
 
         self._build_ui()
         self._wire_events()
@@ -63,7 +112,7 @@ class CombinationPage(QWidget):
         layout.setSpacing(12)
 
         title = QLabel("Combinación lineal de vectores")
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title.setProperty("role", "pageTitle")
         layout.addWidget(title)
 
         info = QLabel(
@@ -93,18 +142,22 @@ class CombinationPage(QWidget):
 
         basis_group = QGroupBox("Vectores generadores (columnas)")
         basis_layout = QVBoxLayout(basis_group)
-        self.combo_basis_table = QTableWidget()
+        self.combo_basis_model = MatrixTableModel(parent=self)
+        self.combo_basis_table = QTableView()
+        self.combo_basis_table.setModel(self.combo_basis_model)
         self.combo_basis_table.setEditTriggers(QAbstractItemView.AllEditTriggers)
-        self.combo_basis_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        helpers.use_interactive_columns(self.combo_basis_table)
         self.combo_basis_table.verticalHeader().setVisible(False)
         basis_layout.addWidget(self.combo_basis_table)
         tables_row.addWidget(basis_group, stretch=2)
 
         target_group = QGroupBox("Vector objetivo b")
         target_layout = QVBoxLayout(target_group)
-        self.combo_target_table = QTableWidget()
+        self.combo_target_model = MatrixTableModel(parent=self)
+        self.combo_target_table = QTableView()
+        self.combo_target_table.setModel(self.combo_target_model)
         self.combo_target_table.setEditTriggers(QAbstractItemView.AllEditTriggers)
-        self.combo_target_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        helpers.use_interactive_columns(self.combo_target_table)
         self.combo_target_table.verticalHeader().setVisible(False)
         target_layout.addWidget(self.combo_target_table)
         tables_row.addWidget(target_group, stretch=1)
@@ -125,14 +178,17 @@ class CombinationPage(QWidget):
         self.alert_banner = AlertBanner()
         layout.addWidget(self.alert_banner)
 
-        self.combo_result_output = QTextEdit()
+        # ``QPlainTextEdit`` maqueta por bloques de texto plano, mucho más
+        # barato que el documento enriquecido de ``QTextEdit`` en informes largos.
+        self.combo_result_output = QPlainTextEdit()
         self.combo_result_output.setReadOnly(True)
         self.combo_result_output.setMinimumHeight(260)
         layout.addWidget(self.combo_result_output)
 
     def _wire_events(self) -> None:
-        self.combo_dim_spin.valueChanged.connect(self._update_tables)
-        self.combo_vectors_spin.valueChanged.connect(self._update_tables)
+        self._flush_pending_resize = helpers.debounce_spin_boxes(
+            self, (self.combo_dim_spin, self.combo_vectors_spin), self._update_tables
+        )
         self.combo_resolve_button.clicked.connect(self._on_resolve)
         self.combo_steps_button.clicked.connect(self._on_show_steps)
         self.combo_clear_button.clicked.connect(self._on_clear)
@@ -142,76 +198,80 @@ class CombinationPage(QWidget):
         rows = self.combo_dim_spin.value()
         cols = self.combo_vectors_spin.value()
 
-        self.combo_basis_table.blockSignals(True)
-        self.combo_basis_table.setRowCount(rows)
-        self.combo_basis_table.setColumnCount(cols)
-        self.combo_basis_table.setHorizontalHeaderLabels([f"v{j + 1}" for j in range(cols)])
-        helpers.ensure_table_defaults(self.combo_basis_table)
-        self.combo_basis_table.blockSignals(False)
-
-        self.combo_target_table.blockSignals(True)
-        self.combo_target_table.setRowCount(rows)
-        self.combo_target_table.setColumnCount(1)
-        self.combo_target_table.setHorizontalHeaderLabels(["b"])
-        helpers.ensure_table_defaults(self.combo_target_table)
-        self.combo_target_table.blockSignals(False)
+        # Cada ``resize`` es un único reinicio del modelo: la vista repinta una vez.
+        self.combo_basis_model.resize(rows, cols, helpers.column_labels("v", cols))
+        self.combo_target_model.resize(rows, 1, ("b",))
 
     def _on_resolve(self) -> None:
+        # ``analizar`` ajusta el tamaño del ViewModel compartido antes de
+        # resolver: nunca debe haber dos tareas usándolo a la vez.
+        if self._solve_running:
+            return
+        self._flush_pending_resize()
         self._last_result = None
         try:
-            basis_rows = helpers.table_to_matrix(self.combo_basis_table)
+            basis_rows = self.combo_basis_model.to_matrix()
             generadores = helpers.columns_from_rows(basis_rows)
-            target_rows = helpers.table_to_matrix(self.combo_target_table)
+            target_rows = self.combo_target_model.to_matrix()
             objetivo = [row[0] for row in target_rows]
+        except ValueError as exc:
+            self._show_error(str(exc))
+            return
 
-            resultado = self._vm.analizar(generadores, objetivo)
-            self._last_result = _StoredResult(resultado)
-
-            lines: List[str] = []
-            lines.append("Matriz aumentada [A|b]:")
-            lines.extend(helpers.matrix_lines(resultado.augmented_matrix, indent="  "))
-            lines.append("")
-
-            interpretacion = resultado.interpretation
-            lines.append(f"Interpretación: {interpretacion.summary}")
-            for detail in interpretacion.details:
-                lines.append(f"  - {detail}")
-            lines.append("")
+        self._solve_ticket += 1
+        key = (helpers.matrix_key(generadores), tuple(objetivo))
+        cached = self._solve_cache.get(key)
+        if cached is not None:
+            self._show_result(*cached)
+            return
 
-            lines.extend(
-                helpers.format_result_lines(
-                    resultado.solver_result,
-                    resultado.coefficient_labels,
-                    homogeneous=resultado.is_homogeneous,
-                )
-            )
+        # Gauss–Jordan y el armado del texto corren en el pool de hilos; el
+        # botón queda deshabilitado hasta que la tarea termine.
+        self._pending_key = key
+        self._solve_running = True
+        self.combo_resolve_button.setEnabled(False)
+        QThreadPool.globalInstance().start(
+            _SolveTask(self._solve_ticket, self._vm, generadores, objetivo, self._solve_signals)
+        )
 
-            solucion = resultado.solver_result.solution
-            if solucion is not None:
-                producto = self._multiplicar_columnas(generadores, solucion)
-                lines.append("")
-                lines.append("Verificación Ax = b:")
-                lines.append(f"  A·x = {helpers.format_vector(producto)}")
-                lines.append(f"  b   = {helpers.format_vector(objetivo)}")
-                coincide = producto == objetivo
-                lines.append(f"  Coinciden: {'sí' if coincide else 'no'}")
+    def _on_solve_finished(self, ticket: int, resultado: CombinationResultVM, text: str) -> None:
+        self._finish_task()
+        # El resultado es válido para su entrada aunque ya no se muestre.
+        self._solve_cache.put(self._pending_key, (resultado, text))
+        self._pending_key = None
+        if ticket == self._solve_ticket:
+            self._show_result(resultado, text)
+
+    def _on_solve_failed(self, ticket: int, message: str) -> None:
+        self._finish_task()
+        self._pending_key = None
+        if ticket == self._solve_ticket:
+            self._show_error(message)
+
+    def _finish_task(self) -> None:
+        self._solve_running = False
+        self.combo_resolve_button.setEnabled(True)
+
+    def _show_result(self, resultado: CombinationResultVM, text: str) -> None:
+        self._last_result = _StoredResult(resultado)
+        self.combo_result_output.setPlainText(text)
+        self.combo_steps_button.setEnabled(bool(resultado.solver_result.steps))
+        self.alert_banner.show_message(
+            resultado.interpretation.summary,
+            level=resultado.interpretation.level,
+        )
 
-            lines.append("")
-            lines.extend(helpers.format_steps_lines(resultado.solver_result))
-
-            self.combo_result_output.setPlainText("\n".join(lines))
-            self.combo_steps_button.setEnabled(bool(resultado.solver_result.steps))
-            self.alert_banner.show_message(
-                interpretacion.summary,
-                level=interpretacion.level,
-            )
-        except Exception as exc:
-            self.alert_banner.show_message(str(exc), level="error")
-            QMessageBox.critical(self, "Error", str(exc))
+    def _show_error(self, message: str) -> None:
+        self.alert_banner.show_message(message, level="error")
+        QMessageBox.critical(self, "Error", message)
 
     def _on_clear(self) -> None:
-        helpers.fill_table_with_zero(self.combo_basis_table)
-        helpers.fill_table_with_zero(self.combo_target_table)
+        self._flush_pending_resize()
+        # Una tarea en curso sigue ocupando el ViewModel; solo se descarta su
+        # respuesta y el botón se reactiva cuando termine.
+        self._solve_ticket += 1
+        self.combo_basis_model.fill()
+        self.combo_target_model.fill()
         self.combo_result_output.clear()
         self.combo_steps_button.setEnabled(False)
         self._last_result = None
@@ -228,9 +288,50 @@ class CombinationPage(QWidget):
             steps,
             pivot_cols=self._last_result.explanation.solver_result.pivot_cols or [],
             title="Pasos Gauss–Jordan (combinación lineal)",
+            batch_size=self.MAX_DISPLAY_STEPS,
         )
 
     # -------------------------- Helpers internos --------------------------
+    @staticmethod
+    def _build_report(
+        resultado: CombinationResultVM,
+        generadores: List[List[Fraction]],
+        objetivo: List[Fraction],
+    ) -> str:
+        """Arma el texto del análisis; no toca widgets, así que es apto para hilos."""
+
+        lines: List[str] = []
+        lines.append("Matriz aumentada [A|b]:")
+        lines.extend(helpers.matrix_lines(resultado.augmented_matrix, indent="  "))
+        lines.append("")
+
+        interpretacion = resultado.interpretation
+        lines.append(f"Interpretación: {interpretacion.summary}")
+        for detail in interpretacion.details:
+            lines.append(f"  - {detail}")
+        lines.append("")
+
+        lines.extend(
+            helpers.format_result_lines(
+                resultado.solver_result,
+                resultado.coefficient_labels,
+                homogeneous=resultado.is_homogeneous,
+            )
+        )
+
+        solucion = resultado.solver_result.solution
+        if solucion is not None:
+            producto = CombinationPage._multiplicar_columnas(generadores, solucion)
+            lines.append("")
+            lines.append("Verificación Ax = b:")
+            lines.append(f"  A·x = {helpers.format_vector(producto)}")
+            lines.append(f"  b   = {helpers.format_vector(objetivo)}")
+            coincide = producto == objetivo
+            lines.append(f"  Coinciden: {'sí' if coincide else 'no'}")
+
+        lines.append("")
+        return "\n".join(chain(lines, helpers.format_steps_lines(resultado.solver_result)))
+
     @staticmethod
     def _multiplicar_columnas(
         columnas: List[List[Fraction]],
@@ -8,6 +8,8 @@ vínculo entre teoría y comunicación clara al estudiante).
 
 from __future__ import annotations
 
+from typing import Optional
+
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel
 
@@ -27,6 +29,9 @@ class AlertBanner(QFrame):
         self.setFrameShape(QFrame.StyledPanel)
         self.setObjectName("alertBanner")
         self.setVisible(False)
+        # Nivel cuya hoja de estilo está aplicada; evita reanalizarla si se
+        # repite el mismo nivel.
+        self._current_level: Optional[str] = None
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
@@ -40,8 +45,10 @@ class AlertBanner(QFrame):
     def show_message(self, text: str, level: str = "info") -> None:
         """Muestra el banner con el nivel indicado."""
 
-        palette = self._PALETTES.get(level, self._PALETTES["info"])
-        self.setStyleSheet(palette)
+        level = level if level in self._PALETTES else "info"
+        if level != self._current_level:
+            self.setStyleSheet(self._PALETTES[level])
+            self._current_level = level
         self._label.setText(text)
         self.setVisible(True)
 
@@ -8,19 +8,18 @@ en las distintas páginas.
 
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+from typing import Dict, Iterable, List, Sequence
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, QRect, QSize, Qt
+from PySide6.QtGui import QBrush, QColor, QFontMetrics, QPainter
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QDialog,
-    QGroupBox,
     QHeaderView,
     QLabel,
-    QScrollArea,
-    QSizePolicy,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -29,45 +28,171 @@ from ViewModels.resolucion_matriz_vm import StepVM
 
 
 PIVOT_COLOR = QColor(64, 125, 188)
-TEXT_COLOR = QColor(255, 255, 255)
+# Color global de Qt: no requiere construir un ``QColor`` propio.
+TEXT_COLOR = Qt.white
+# Pinceles compartidos por todas las celdas para no crear uno por consulta.
+PIVOT_BRUSH = QBrush(PIVOT_COLOR)
+TEXT_BRUSH = QBrush(TEXT_COLOR)
 
+# Por encima de esta dimensión la matriz de un paso no se dibuja; solo se
+# muestra un resumen para no crear tablas que no caben en pantalla.
+STEP_PREVIEW_MAX_DIM = 30
 
-def create_step_widget(step: StepVM) -> QWidget:
-    """Crea un widget compacto con la información de una operación Gauss-Jordan."""
+# Nombre del diálogo de pasos; permite localizarlo entre los hijos de la
+# página para reutilizarlo.
+STEPS_DIALOG_NAME = "stepsDialog"
 
-    pivot_txt = ""
-    if step.pivot_row is not None and step.pivot_col is not None:
-        pivot_txt = f"  |  pivote x{step.pivot_col + 1} en ({step.pivot_row + 1},{step.pivot_col + 1})"
+# Pasos que ``StepsListModel`` entrega a la vista en cada ``fetchMore``.
+STEPS_FETCH_BATCH = 20
 
-    widget = QGroupBox(f"Paso {step.number} – {step.description}{pivot_txt}")
-    widget.setStyleSheet("QGroupBox { color: #ffffff; }")
-    layout = QVBoxLayout()
-    widget.setLayout(layout)
 
-    matrix = step.after_matrix
-    if not matrix:
-        return widget
+class StepsListModel(QAbstractTableModel):
+    """Lista los pasos de Gauss-Jordan: una fila por paso.
 
-    rows = len(matrix)
-    cols = len(matrix[0]) if rows else 0
-    table = QTableWidget(rows, cols)
-    table.verticalHeader().setVisible(False)
-    table.horizontalHeader().setVisible(False)
-    table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-    table.setFixedHeight(20 * max(rows, 1) + 2)
+    La columna de la matriz entrega el ``StepVM`` en ``Qt.UserRole`` para
+    que ``MatrixDelegate`` la dibuje.
+    """
 
-    for i in range(rows):
-        for j in range(cols):
-            item = QTableWidgetItem(str(matrix[i][j]))
-            item.setTextAlignment(Qt.AlignCenter)
-            item.setForeground(TEXT_COLOR)
-            if step.pivot_row is not None and step.pivot_col is not None and i == step.pivot_row and j == step.pivot_col:
-                item.setBackground(PIVOT_COLOR)
-            table.setItem(i, j, item)
+    HEADERS = ("Operación", "Matriz resultante")
+    DESCRIPTION_COLUMN = 0
+    MATRIX_COLUMN = 1
 
-    table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-    layout.addWidget(table)
-    return widget
+    def __init__(
+        self,
+        steps: Sequence[StepVM],
+        parent: QObject | None = None,
+        batch_size: int = STEPS_FETCH_BATCH,
+    ) -> None:
+        super().__init__(parent)
+        self._steps = steps
+        self._batch_size = max(1, batch_size)
+        # Filas expuestas a la vista; el resto se entrega con ``fetchMore``
+        # conforme el usuario se desplaza.
+        self._loaded = min(len(steps), self._batch_size)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._steps)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        remaining = len(self._steps) - self._loaded
+        count = min(self._batch_size, remaining)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        step = self._steps[index.row()]
+        column = index.column()
+        if role == Qt.UserRole:
+            return step
+        if role == Qt.DisplayRole:
+            # ``StepVM.title`` ya incluye número, descripción y pivote, y se
+            # calcula una sola vez por paso.
+            return step.title if column == self.DESCRIPTION_COLUMN else None
+        if role == Qt.TextAlignmentRole:
+            if column == self.DESCRIPTION_COLUMN:
+                return Qt.AlignLeft | Qt.AlignVCenter
+            return Qt.AlignCenter
+        if role == Qt.ForegroundRole:
+            return TEXT_BRUSH
+        return None
+
+
+class MatrixDelegate(QStyledItemDelegate):
+    """Dibuja la matriz de un paso como una cuadrícula de texto.
+
+    Cada celda se pinta con ``QPainter.drawText``; el pivote se resalta con
+    un único ``fillRect``. No se crean widgets ni ítems por celda.
+    """
+
+    CELL_HEIGHT = 20
+    CELL_PADDING = 12
+    MARGIN = 4
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        # Anchos de columna por número de paso: se miden una vez y se
+        # reutilizan en cada repintado y en ``sizeHint``.
+        self._widths: Dict[int, List[int]] = {}
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        step: StepVM = index.data(Qt.UserRole)
+        cells = step.display_cells
+        if not cells:
+            return
+
+        painter.save()
+        painter.setPen(TEXT_COLOR)
+        left = option.rect.left() + self.MARGIN
+        top = option.rect.top() + self.MARGIN
+        if self._is_oversized(cells):
+            painter.drawText(
+                option.rect.adjusted(self.MARGIN, 0, 0, 0),
+                Qt.AlignLeft | Qt.AlignVCenter,
+                self._summary(cells),
+            )
+            painter.restore()
+            return
+
+        widths = self._column_widths(option.fontMetrics, step)
+        for i, row in enumerate(cells):
+            x = left
+            y = top + i * self.CELL_HEIGHT
+            for j, text in enumerate(row):
+                rect = QRect(x, y, widths[j], self.CELL_HEIGHT)
+                if i == step.pivot_row and j == step.pivot_col:
+                    painter.fillRect(rect, PIVOT_BRUSH)
+                painter.drawText(rect, Qt.AlignCenter, text)
+                x += widths[j]
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        step: StepVM = index.data(Qt.UserRole)
+        cells = step.display_cells
+        if not cells:
+            return QSize(0, 0)
+        if self._is_oversized(cells):
+            width = option.fontMetrics.horizontalAdvance(self._summary(cells))
+            return QSize(width + 2 * self.MARGIN, self.CELL_HEIGHT + 2 * self.MARGIN)
+        width = sum(self._column_widths(option.fontMetrics, step))
+        height = len(cells) * self.CELL_HEIGHT
+        return QSize(width + 2 * self.MARGIN, height + 2 * self.MARGIN)
+
+    def _column_widths(self, metrics: QFontMetrics, step: StepVM) -> List[int]:
+        widths = self._widths.get(step.number)
+        if widths is None:
+            cells = step.display_cells
+            widths = [
+                max(metrics.horizontalAdvance(row[j]) for row in cells) + self.CELL_PADDING
+                for j in range(len(cells[0]))
+            ]
+            self._widths[step.number] = widths
+        return widths
+
+    @staticmethod
+    def _is_oversized(cells: List[List[str]]) -> bool:
+        return len(cells) > STEP_PREVIEW_MAX_DIM or len(cells[0]) > STEP_PREVIEW_MAX_DIM
+
+    @staticmethod
+    def _summary(cells: List[List[str]]) -> str:
+        return f"Matriz {len(cells)}×{len(cells[0])} (demasiado grande para previsualizar)"
 
 
 def show_steps_dialog(
@@ -75,13 +200,50 @@ def show_steps_dialog(
     steps: Sequence[StepVM],
     pivot_cols: Iterable[int] = (),
     title: str = "Pasos Gauss–Jordan",
+    batch_size: int = STEPS_FETCH_BATCH,
 ) -> None:
-    """Abre un diálogo modal con todos los pasos registrados."""
+    """Abre un diálogo modal con todos los pasos registrados.
+
+    Los pasos se listan en una única ``QTableView`` (una fila por paso) y
+    ``MatrixDelegate`` dibuja cada matriz directamente, sin widgets por
+    paso ni por celda. El diálogo queda como hijo de ``parent`` y se
+    reutiliza mientras se pidan los mismos pasos. Se abre con ``open()``
+    (modal respecto a la ventana, sin bloquear) y las filas se cargan por
+    lotes de ``batch_size`` a medida que el usuario se desplaza.
+    """
 
     if not steps:
         return
 
+    pivot_cols = tuple(pivot_cols)
+    # ``steps`` sigue vivo mientras el diálogo lo referencie, así que su
+    # ``id`` identifica sin ambigüedad el resultado mostrado.
+    key = (id(steps), pivot_cols, title)
+    dialog = parent.findChild(QDialog, STEPS_DIALOG_NAME, Qt.FindDirectChildrenOnly)
+    if dialog is not None:
+        if getattr(dialog, "steps_key", None) == key:
+            dialog.open()
+            dialog.raise_()
+            return
+        dialog.setObjectName("")
+        dialog.deleteLater()
+
+    dialog = _build_steps_dialog(parent, steps, pivot_cols, title, batch_size)
+    dialog.steps_key = key
+    dialog.open()
+
+
+def _build_steps_dialog(
+    parent: QWidget,
+    steps: Sequence[StepVM],
+    pivot_cols: Sequence[int],
+    title: str,
+    batch_size: int,
+) -> QDialog:
+    """Construye (sin mostrar) el diálogo de pasos para ``show_steps_dialog``."""
+
     dialog = QDialog(parent)
+    dialog.setObjectName(STEPS_DIALOG_NAME)
     dialog.setWindowTitle(title)
     dialog.resize(700, 500)
     vbox = QVBoxLayout(dialog)
@@ -94,17 +256,14 @@ def show_steps_dialog(
     header.setStyleSheet("color: #ffffff; font-weight: bold; margin-bottom: 6px;")
     vbox.addWidget(header)
 
-    scroll = QScrollArea()
-    scroll.setWidgetResizable(True)
-    container = QWidget()
-    container_layout = QVBoxLayout()
-    container.setLayout(container_layout)
-
-    for step in steps:
-        container_layout.addWidget(create_step_widget(step))
-
-    container_layout.addStretch(1)
-    scroll.setWidget(container)
-    vbox.addWidget(scroll)
-
-    dialog.exec()
+    view = QTableView()
+    view.setModel(StepsListModel(steps, view, batch_size=batch_size))
+    view.setItemDelegateForColumn(StepsListModel.MATRIX_COLUMN, MatrixDelegate(view))
+    view.verticalHeader().setVisible(False)
+    view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+    view.horizontalHeader().setSectionResizeMode(StepsListModel.DESCRIPTION_COLUMN, QHeaderView.Stretch)
+    view.setSelectionMode(QAbstractItemView.NoSelection)
+    view.setWordWrap(True)
+    vbox.addWidget(view)
+    return dialog
@@ -15,37 +15,79 @@ Separar estas rutinas evita que la ventana principal se convierta en un
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from contextlib import contextmanager
 from fractions import Fraction
+from functools import lru_cache
 
-from typing import Iterable, List, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QTableWidget, QTableWidgetItem
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QHeaderView, QSpinBox, QTableView, QTableWidget, QTableWidgetItem, QWidget
 
-from ViewModels.resolucion_matriz_vm import ResultVM
+if TYPE_CHECKING:
+    # Solo para anotaciones: importarlo en tiempo de ejecución cargaría toda
+    # la capa de Gauss–Jordan al arrancar la ventana.
+    from ViewModels.resolucion_matriz_vm import ResultVM
 
 
-def matrix_lines(matrix: Sequence[Sequence[Fraction | float]] | None, indent: str = "") -> List[str]:
+@lru_cache(maxsize=None)
+def shared_font(point_size: int, bold: bool = False, italic: bool = False) -> QFont:
+    """Devuelve una fuente compartida por todas las vistas.
+
+    ``setFont`` copia el valor, así que la misma instancia puede reutilizarse
+    sin riesgo; quien la reciba no debe modificarla.
+    """
+
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
+
+
+@lru_cache(maxsize=None)
+def column_labels(prefix: str, count: int) -> Tuple[str, ...]:
+    """Devuelve ``(prefix1, ..., prefixN)``; se calcula una vez por tamaño."""
+
+    return tuple(f"{prefix}{j + 1}" for j in range(count))
+
+
+def matrix_lines(matrix: Sequence[Sequence[Fraction | float]] | None, indent: str = "") -> Iterator[str]:
     """Renderiza una matriz aumentada fila por fila.
 
     El formato replica los ejemplos vistos en clase: cada fila se envuelve
-    entre corchetes y se respeta una sangría opcional ``indent``.
+    entre corchetes y se respeta una sangría opcional ``indent``. Las líneas
+    se producen una a una para que quien las consume no necesite una lista
+    intermedia.
     """
 
     if not matrix:
-        return [f"{indent}—"]
-    return [f"{indent}[{', '.join(str(value) for value in row)}]" for row in matrix]
+        yield f"{indent}—"
+        return
+    for row in matrix:
+        yield f"{indent}[{', '.join(map(str, row))}]"
+
+
+_STATUS_TEXT = {
+    "UNICA": "Solución única",
+    "INFINITAS": "Infinitas soluciones",
+    "INCONSISTENTE": "Sistema inconsistente",
+}
 
 
 def status_to_text(status: str) -> str:
     """Traduce el estado del solucionador a mensajes legibles."""
 
-    mapping = {
-        "UNICA": "Solución única",
-        "INFINITAS": "Infinitas soluciones",
-        "INCONSISTENTE": "Sistema inconsistente",
-    }
-    return mapping.get(status, status)
+    return _STATUS_TEXT.get(status, status)
+
+
+@lru_cache(maxsize=64)
+def format_pivot_cols(pivot_cols: Tuple[int, ...]) -> str:
+    """Lista las columnas pivote como ``x1, x3`` (``—`` si no hay)."""
+
+    return ", ".join(f"x{j + 1}" for j in pivot_cols) or "—"
 
 
 def format_result_lines(
@@ -60,17 +102,16 @@ def format_result_lines(
 
     if result.status == "UNICA" and result.solution is not None:
         lines.append(f"{indent}Solución:")
-        for label, value in zip(variable_labels, result.solution):
-            lines.append(f"{indent}  {label} = {value}")
+        lines.extend(_assignment_lines(variable_labels, result.solution, indent))
     elif result.status == "INFINITAS" and result.parametric is not None:
         lines.append(f"{indent}Solución particular:")
-        for label, value in zip(variable_labels, result.parametric.particular):
-            lines.append(f"{indent}  {label} = {value}")
+        lines.extend(_assignment_lines(variable_labels, result.parametric.particular, indent))
         if result.parametric.direcciones:
             lines.append(f"{indent}Direcciones asociadas:")
-            for idx, direction in enumerate(result.parametric.direcciones, start=1):
-                direction_str = ", ".join(str(value) for value in direction)
-                lines.append(f"{indent}  t{idx}: ({direction_str})")
+            lines.extend(
+                f"{indent}  t{idx}: {format_vector(direction)}"
+                for idx, direction in enumerate(result.parametric.direcciones, start=1)
+            )
     elif result.status == "INCONSISTENTE":
         lines.append(f"{indent}No existe solución compatible con B.")
 
@@ -85,48 +126,179 @@ def format_result_lines(
     return lines
 
 
-def format_steps_lines(result: ResultVM, indent: str = "") -> List[str]:
-    """Devuelve una vista rápida de los pasos de Gauss-Jordan apta para estudio."""
+def _assignment_lines(
+    variable_labels: Sequence[str],
+    values: Iterable[Fraction | float],
+    indent: str,
+) -> List[str]:
+    """Formatea ``x = valor`` para cada variable en una sola comprensión."""
+
+    prefix = f"{indent}  "
+    return [f"{prefix}{label} = {value}" for label, value in zip(variable_labels, values)]
+
+
+def format_steps_lines(result: ResultVM, indent: str = "") -> Iterator[str]:
+    """Produce una vista rápida de los pasos de Gauss-Jordan apta para estudio.
+
+    Es un generador: con muchos pasos, las líneas se escriben directamente en
+    el texto final sin materializar antes una lista completa.
+    """
 
     if not result.steps:
-        return [f"{indent}No se registraron pasos."]
-    lines = [f"{indent}Pasos Gauss–Jordan:"]
+        yield f"{indent}No se registraron pasos."
+        return
+    yield f"{indent}Pasos Gauss–Jordan:"
+    step_indent = indent + "    "
     for step in result.steps:
-        lines.append(f"{indent}  [{step.number}] {step.description}")
+        yield f"{indent}  [{step.number}] {step.description}"
         if step.after_matrix:
-            lines.extend(matrix_lines(step.after_matrix, indent + "    "))
-    return lines
+            yield from matrix_lines(step.after_matrix, step_indent)
+
+
+def matrix_key(rows: Sequence[Sequence[Fraction]]) -> Tuple[Tuple[Fraction, ...], ...]:
+    """Convierte una matriz en tuplas anidadas, aptas como clave de caché."""
+
+    return tuple(map(tuple, rows))
+
+
+class ResultCache:
+    """Caché LRU de resultados indexada por las matrices de entrada.
+
+    Resolver dos veces el mismo sistema sin editar las tablas devuelve el
+    resultado guardado en lugar de repetir Gauss–Jordan.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
+def use_interactive_columns(table: QTableView, width: int = 72) -> None:
+    """Columnas de ancho fijo inicial que el usuario puede ajustar.
+
+    A diferencia de ``Stretch``, el modo ``Interactive`` no reparte el ancho
+    de nuevo al cambiar filas o columnas. Doble clic en una cabecera ajusta
+    esa columna a su contenido.
+    """
+
+    header = table.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.Interactive)
+    header.setDefaultSectionSize(width)
+    header.sectionDoubleClicked.connect(table.resizeColumnToContents)
+    table.setWordWrap(False)
+
+
+# Espera (ms) tras el último cambio de un spin box de dimensiones antes de
+# reconstruir la tabla correspondiente.
+SPIN_DEBOUNCE_MS = 80
+
+
+def debounce_spin_boxes(
+    owner: QWidget,
+    spin_boxes: Sequence[QSpinBox],
+    apply: Callable[[], None],
+    delay_ms: int = SPIN_DEBOUNCE_MS,
+) -> Callable[[], None]:
+    """Ejecuta ``apply`` una sola vez cuando los spin boxes dejan de cambiar.
+
+    Cada ``valueChanged`` reinicia un temporizador de ``delay_ms``; al
+    terminar la edición (``editingFinished``) el cambio pendiente se aplica
+    de inmediato. Devuelve la función que hace eso mismo, para llamarla
+    antes de leer la tabla.
+    """
+
+    timer = QTimer(owner)
+    timer.setSingleShot(True)
+    timer.setInterval(delay_ms)
+    timer.timeout.connect(apply)
+
+    def restart(_value: int) -> None:
+        # ``start()`` sin argumentos: conectar ``timer.start`` directamente
+        # usaría el valor del spin box como intervalo.
+        timer.start()
+
+    def flush() -> None:
+        if timer.isActive():
+            timer.stop()
+            apply()
+
+    for spin in spin_boxes:
+        spin.valueChanged.connect(restart)
+        spin.editingFinished.connect(flush)
+    return flush
+
+
+@contextmanager
+def bulk_table_update(table: QTableWidget) -> Iterator[None]:
+    """Suspende repintados y señales de ``table`` durante escrituras en bloque.
+
+    Al salir se reactivan las actualizaciones y Qt repinta la tabla una sola
+    vez, en lugar de hacerlo por cada celda modificada. Pensado para los
+    bucles celda a celda de ``QTableWidget``; con un modelo propio basta un
+    único reinicio del modelo.
+    """
+
+    was_enabled = table.updatesEnabled()
+    table.setUpdatesEnabled(False)
+    was_blocked = table.blockSignals(True)
+    try:
+        yield
+    finally:
+        table.blockSignals(was_blocked)
+        table.setUpdatesEnabled(was_enabled)
+
+
+@lru_cache(maxsize=1)
+def _zero_item() -> QTableWidgetItem:
+    """Plantilla de celda ``"0"`` centrada; se copia con ``clone()``."""
+
+    item = QTableWidgetItem("0")
+    item.setTextAlignment(Qt.AlignCenter)
+    return item
 
 
 def ensure_table_defaults(table: QTableWidget) -> None:
     """Garantiza que cada celda almacene un número en texto (por defecto 0)."""
 
-    for i in range(table.rowCount()):
-        for j in range(table.columnCount()):
-            item = table.item(i, j)
-            if item is None:
-                item = QTableWidgetItem("0")
-                table.setItem(i, j, item)
-            if item.text().strip() == "":
-                item.setText("0")
-            item.setTextAlignment(Qt.AlignCenter)
+    template = _zero_item()
+    with bulk_table_update(table):
+        for i in range(table.rowCount()):
+            for j in range(table.columnCount()):
+                item = table.item(i, j)
+                if item is None:
+                    table.setItem(i, j, template.clone())
+                    continue
+                if item.text().strip() == "":
+                    item.setText("0")
+                item.setTextAlignment(Qt.AlignCenter)
 
 
 def fill_table_with_zero(table: QTableWidget) -> None:
     """Reinicia todas las celdas de la tabla al valor cero."""
 
-    for i in range(table.rowCount()):
-        for j in range(table.columnCount()):
-            item = table.item(i, j)
-            if item is None:
-                item = QTableWidgetItem("0")
-                table.setItem(i, j, item)
-            else:
-                item.setText("0")
-            item.setTextAlignment(Qt.AlignCenter)
+    template = _zero_item()
+    with bulk_table_update(table):
+        # ``clearContents`` libera los items en C++ de una vez; después basta
+        # con colocar copias de la plantilla en lugar de reescribir cada celda.
+        table.clearContents()
+        for i in range(table.rowCount()):
+            for j in range(table.columnCount()):
+                table.setItem(i, j, template.clone())
 
 
-def _parse_number(text: str) -> Fraction:
+def parse_number(text: str) -> Fraction:
     """Convierte cadenas como ``3/5`` o ``2.75`` en fracciones exactas."""
 
     normalized = text.replace(" ", "")
@@ -146,14 +318,19 @@ def table_to_matrix(table: QTableWidget) -> List[List[Fraction]]:
     ViewModel opera con arreglos numéricos.
     """
 
+    # Cada llamada a ``table.item``/``item.text`` cruza a C++: se resuelven
+    # una sola vez por celda y fuera de los bucles cuando es posible.
+    item_at = table.item
+    cols = range(table.columnCount())
     data: List[List[Fraction]] = []
     for i in range(table.rowCount()):
         row_vals: List[Fraction] = []
-        for j in range(table.columnCount()):
-            item = table.item(i, j)
-            text = item.text().strip() if item and item.text() else "0"
+        append = row_vals.append
+        for j in cols:
+            item = item_at(i, j)
+            text = item.text().strip() if item is not None else ""
             try:
-                row_vals.append(_parse_number(text))
+                append(parse_number(text))
             except ValueError as exc:
                 raise ValueError(
                     f"Valor no numérico en fila {i + 1}, columna {j + 1}: '{text}'"
@@ -171,13 +348,13 @@ def columns_from_rows(rows: Sequence[Sequence[Fraction | float]]) -> List[List[F
     for fila in rows:
         if len(fila) != num_cols:
             raise ValueError("Todas las filas deben tener la misma longitud.")
-    return [[Fraction(rows[i][j]) for i in range(len(rows))] for j in range(num_cols)]
+    return [list(map(Fraction, column)) for column in zip(*rows)]
 
 
 def format_vector(values: Iterable[Fraction | float]) -> str:
     """Devuelve una representación tipo tupla ``(v1, v2, ...)``."""
 
-    return "(" + ", ".join(str(x) for x in values) + ")"
+    return "(" + ", ".join(map(str, values)) + ")"
 
 
 def _homogeneous_solution_statement(result: ResultVM, indent: str) -> str:
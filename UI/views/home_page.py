@@ -9,9 +9,10 @@ Introduction*, prefacio). Se mantiene como widget aislado para que el
 from __future__ import annotations
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
+from . import helpers
+
 
 class HomePage(QWidget):
     """Muestra un saludo centrado."""
@@ -24,10 +25,7 @@ class HomePage(QWidget):
 
         titulo = QLabel("Calculadora de Álgebra Lineal")
         titulo.setAlignment(Qt.AlignCenter)
-        fuente = QFont()
-        fuente.setPointSize(18)
-        fuente.setBold(True)
-        titulo.setFont(fuente)
+        titulo.setFont(helpers.shared_font(18, bold=True))
         titulo.setWordWrap(True)
         layout.addWidget(titulo)
 
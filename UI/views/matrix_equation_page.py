@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSignalBlocker, Qt
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QComboBox,
@@ -58,7 +58,7 @@ class MatrixEquationPage(QWidget):
         layout.setSpacing(12)
 
         title = QLabel("Ecuación matricial AX = B")
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title.setProperty("role", "pageTitle")
         layout.addWidget(title)
 
         info = QLabel(
@@ -156,19 +156,17 @@ class MatrixEquationPage(QWidget):
         cols = self.cols_spin.value()
         rhs = self.b_cols_spin.value()
 
-        self.A_table.blockSignals(True)
-        self.A_table.setRowCount(rows_a)
-        self.A_table.setColumnCount(cols)
-        self.A_table.setHorizontalHeaderLabels([f"x{j + 1}" for j in range(cols)])
-        helpers.ensure_table_defaults(self.A_table)
-        self.A_table.blockSignals(False)
+        with helpers.bulk_table_update(self.A_table):
+            self.A_table.setRowCount(rows_a)
+            self.A_table.setColumnCount(cols)
+            self.A_table.setHorizontalHeaderLabels(helpers.column_labels("x", cols))
+            helpers.ensure_table_defaults(self.A_table)
 
-        self.B_table.blockSignals(True)
-        self.B_table.setRowCount(rows_b)
-        self.B_table.setColumnCount(rhs)
-        self.B_table.setHorizontalHeaderLabels([f"b{j + 1}" for j in range(rhs)])
-        helpers.ensure_table_defaults(self.B_table)
-        self.B_table.blockSignals(False)
+        with helpers.bulk_table_update(self.B_table):
+            self.B_table.setRowCount(rows_b)
+            self.B_table.setColumnCount(rhs)
+            self.B_table.setHorizontalHeaderLabels(helpers.column_labels("b", rhs))
+            helpers.ensure_table_defaults(self.B_table)
 
     def _on_solve(self) -> None:
         self._last_result = None
@@ -194,7 +192,7 @@ class MatrixEquationPage(QWidget):
             QMessageBox.critical(self, "Error", str(exc))
             return
 
-        var_labels = [f"x{j + 1}" for j in range(self.cols_spin.value())]
+        var_labels = helpers.column_labels("x", self.cols_spin.value())
         lines: List[str] = []
         lines.append("Matriz A ingresada:")
         lines.extend(helpers.matrix_lines(A_rows, indent="  "))
@@ -231,12 +229,11 @@ class MatrixEquationPage(QWidget):
         self._last_result = None
 
     def _populate_steps_selector(self, result: MatrixEquationResultVM) -> None:
-        self.steps_selector.blockSignals(True)
-        self.steps_selector.clear()
-        for column in result.columns:
-            if column.result.steps:
-                self.steps_selector.addItem(column.label, column.index)
-        self.steps_selector.blockSignals(False)
+        with QSignalBlocker(self.steps_selector):
+            self.steps_selector.clear()
+            for column in result.columns:
+                if column.result.steps:
+                    self.steps_selector.addItem(column.label, column.index)
 
         has_steps = self.steps_selector.count() > 0
         self.steps_selector.setEnabled(has_steps)
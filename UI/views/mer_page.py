@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
+from . import helpers
+
 
 class MerPage(QWidget):
     """Describe los pasos conceptuales del MER utilizados en la aplicación."""
@@ -17,10 +18,7 @@ class MerPage(QWidget):
         layout.setSpacing(12)
 
         titulo = QLabel("Método de Eliminación por Renglones (MER)")
-        fuente = QFont()
-        fuente.setPointSize(17)
-        fuente.setBold(True)
-        titulo.setFont(fuente)
+        titulo.setFont(helpers.shared_font(17, bold=True))
         titulo.setAlignment(Qt.AlignLeft)
         titulo.setWordWrap(True)
         layout.addWidget(titulo)
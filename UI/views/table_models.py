@@ -0,0 +1,152 @@
+"""Modelos de tabla para capturar matrices en las vistas.
+
+``MatrixTableModel`` sustituye a ``QTableWidget`` en las páginas que editan
+matrices: guarda el texto de cada celda en una lista de listas y Qt solo
+consulta ``data`` para las celdas visibles, sin crear un
+``QTableWidgetItem`` por entrada. Junto al texto se conserva el valor ya
+convertido a ``Fraction`` para que resolver no tenga que volver a leerlo.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import List, Optional, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+
+from .helpers import parse_number
+
+
+def _try_parse(text: str) -> Optional[Fraction]:
+    try:
+        return parse_number(text)
+    except ValueError:
+        return None
+
+
+class MatrixTableModel(QAbstractTableModel):
+    """Cuadrícula editable de texto; las celdas vacías valen ``"0"``.
+
+    ``_values`` guarda la fracción de cada celda (``None`` si el texto no es
+    numérico); se actualiza en ``setData`` y en las operaciones en bloque.
+    """
+
+    DEFAULT_TEXT = "0"
+    _ZERO = Fraction(0)
+
+    def __init__(
+        self,
+        rows: int = 0,
+        cols: int = 0,
+        headers: Sequence[str] = (),
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._rows = rows
+        self._cols = cols
+        self._cells: List[List[str]] = [[self.DEFAULT_TEXT] * cols for _ in range(rows)]
+        self._values: List[List[Optional[Fraction]]] = [[self._ZERO] * cols for _ in range(rows)]
+        self._headers: List[str] = list(headers)
+
+    # ------------------------- API de QAbstractTableModel -------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._cols
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._cells[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        text = str(value).strip() or self.DEFAULT_TEXT
+        i, j = index.row(), index.column()
+        if self._cells[i][j] != text:
+            self._cells[i][j] = text
+            self._values[i][j] = _try_parse(text)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if section < len(self._headers) else str(section + 1)
+        return str(section + 1)
+
+    # ------------------------------ Utilidades ------------------------------
+    def resize(self, rows: int, cols: int, headers: Sequence[str] = ()) -> None:
+        """Cambia las dimensiones conservando el texto de las celdas comunes.
+
+        Si la forma y las cabeceras no cambian no se hace nada: reiniciar el
+        modelo obligaría a las vistas a reconstruir todo su estado.
+        """
+
+        headers = list(headers)
+        if rows == self._rows and cols == self._cols and headers == self._headers:
+            return
+        self.beginResetModel()
+        cells = [row[:cols] + [self.DEFAULT_TEXT] * (cols - len(row)) for row in self._cells[:rows]]
+        cells.extend([self.DEFAULT_TEXT] * cols for _ in range(rows - len(cells)))
+        values = [row[:cols] + [self._ZERO] * (cols - len(row)) for row in self._values[:rows]]
+        values.extend([self._ZERO] * cols for _ in range(rows - len(values)))
+        self._cells = cells
+        self._values = values
+        self._rows = rows
+        self._cols = cols
+        self._headers = headers
+        self.endResetModel()
+
+    def set_cells(self, cells: Sequence[Sequence[str]]) -> None:
+        """Reemplaza el contenido completo con un único reinicio del modelo."""
+
+        self.beginResetModel()
+        self._cells = [list(row) for row in cells]
+        self._values = [[_try_parse(text) for text in row] for row in self._cells]
+        self._rows = len(self._cells)
+        self._cols = len(self._cells[0]) if self._cells else 0
+        self.endResetModel()
+
+    def fill(self, text: str = DEFAULT_TEXT) -> None:
+        """Escribe ``text`` en todas las celdas y notifica un solo ``dataChanged``."""
+
+        value = _try_parse(text)
+        self._cells = [[text] * self._cols for _ in range(self._rows)]
+        self._values = [[value] * self._cols for _ in range(self._rows)]
+        if self._rows and self._cols:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self._rows - 1, self._cols - 1),
+                [Qt.DisplayRole, Qt.EditRole],
+            )
+
+    def cell_text(self, row: int, col: int) -> str:
+        return self._cells[row][col]
+
+    def to_matrix(self) -> List[List[Fraction]]:
+        """Devuelve la matriz de fracciones ya convertidas.
+
+        Lanza ``ValueError`` indicando la primera celda cuyo texto no es un
+        número.
+        """
+
+        for i, row in enumerate(self._values):
+            for j, value in enumerate(row):
+                if value is None:
+                    raise ValueError(
+                        f"Valor no numérico en fila {i + 1}, columna {j + 1}: '{self._cells[i][j]}'"
+                    )
+        return [list(row) for row in self._values]
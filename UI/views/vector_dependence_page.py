@@ -59,7 +59,7 @@ class VectorDependencePage(QWidget):
         layout.setSpacing(12)
 
         title = QLabel("Dependencia lineal en ℝⁿ")
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title.setProperty("role", "pageTitle")
         layout.addWidget(title)
 
         description = QLabel(
@@ -123,12 +123,11 @@ class VectorDependencePage(QWidget):
     def _update_table(self) -> None:
         rows = self.dim_spin.value()
         cols = self.vector_spin.value()
-        self.vectors_table.blockSignals(True)
-        self.vectors_table.setRowCount(rows)
-        self.vectors_table.setColumnCount(cols)
-        self.vectors_table.setHorizontalHeaderLabels([f"v{j + 1}" for j in range(cols)])
-        helpers.ensure_table_defaults(self.vectors_table)
-        self.vectors_table.blockSignals(False)
+        with helpers.bulk_table_update(self.vectors_table):
+            self.vectors_table.setRowCount(rows)
+            self.vectors_table.setColumnCount(cols)
+            self.vectors_table.setHorizontalHeaderLabels(helpers.column_labels("v", cols))
+            helpers.ensure_table_defaults(self.vectors_table)
 
     def _on_analyze(self) -> None:
         self._last_result = None
@@ -41,7 +41,7 @@ class VectorPropertiesPage(QWidget):
 
         title = QLabel("Propiedades algebraicas de ℝⁿ")
         title.setAlignment(Qt.AlignLeft)
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title.setProperty("role", "pageTitle")
         layout.addWidget(title)
 
         explanation = QLabel(
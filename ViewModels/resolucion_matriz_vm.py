@@ -27,6 +27,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from fractions import Fraction
+from functools import cached_property
 from typing import List, Optional
 
 # Importamos clases del dominio. Estas importaciones se resuelven de forma
@@ -80,6 +81,28 @@ class StepVM:
     affected_rows: Optional[List[int]] = None
     factor: Optional[Fraction] = None
 
+    @cached_property
+    def display_cells(self) -> List[List[str]]:
+        """Texto de cada entrada de `after_matrix`, calculado una sola vez.
+
+        Las vistas reutilizan esta cuadrícula cada vez que se reabre el
+        diálogo de pasos en lugar de volver a convertir cada fracción.
+        """
+        return [list(map(str, row)) for row in self.after_matrix]
+
+    @cached_property
+    def pivot_text(self) -> str:
+        """Sufijo que describe el pivote del paso (vacío si no aplica)."""
+        if self.pivot_row is None or self.pivot_col is None:
+            return ""
+        col = self.pivot_col + 1
+        return f"  |  pivote x{col} en ({self.pivot_row + 1},{col})"
+
+    @cached_property
+    def title(self) -> str:
+        """Encabezado completo del paso tal como lo muestran las vistas."""
+        return f"Paso {self.number} – {self.description}{self.pivot_text}"
+
 
 @dataclass
 class ParametricVM:
@@ -4,9 +4,13 @@ from fractions import Fraction
 from Operadores.solvers import classify_solution, solve_AX_B, solve_Ax_b
 from Operadores.vectores import check_neutro, check_conmutativa, Vector
 from ViewModels.linear_algebra_vm import LinearAlgebraViewModel
+from ViewModels.resolucion_matriz_vm import StepVM
 from ViewModels.vector_propiedades_vm import VectorPropiedadesViewModel
 from ViewModels.vector_dependencia_vm import VectorDependenciaViewModel
 from Operadores.SolucionGaussJordan.solucion import Solucion
+from PySide6.QtCore import Qt
+from UI.views.helpers import ResultCache, matrix_key
+from UI.views.table_models import MatrixTableModel
 
 
 class TestSolvers(unittest.TestCase):
@@ -152,5 +156,103 @@ class TestVectorDependenciaViewModel(unittest.TestCase):
         self.assertEqual(resultado.interpretation.level, "warning")
         self.assertIn("dependientes", resultado.interpretation.summary.lower())
 
+
+class TestStepVM(unittest.TestCase):
+    def test_display_cells_cached(self):
+        paso = StepVM(
+            number=1,
+            operation="ESCALAR_FILA",
+            description="F1 -> 1/2 F1",
+            before_matrix=[],
+            after_matrix=[[Fraction(1), Fraction(1, 2)], [Fraction(0), Fraction(-3)]],
+        )
+        celdas = paso.display_cells
+        self.assertEqual(celdas, [["1", "1/2"], ["0", "-3"]])
+        self.assertIs(paso.display_cells, celdas)
+
+    def test_pivot_text(self):
+        paso = StepVM(1, "NORMALIZAR_PIVOTE", "F2 -> F2/3", [], [[Fraction(1)]], pivot_row=1, pivot_col=0)
+        self.assertEqual(paso.pivot_text, "  |  pivote x1 en (2,1)")
+        sin_pivote = StepVM(2, "INICIO", "Matriz inicial", [], [[Fraction(1)]])
+        self.assertEqual(sin_pivote.pivot_text, "")
+
+    def test_title(self):
+        paso = StepVM(3, "NORMALIZAR_PIVOTE", "F2 -> F2/3", [], [[Fraction(1)]], pivot_row=1, pivot_col=0)
+        self.assertEqual(paso.title, "Paso 3 – F2 -> F2/3  |  pivote x1 en (2,1)")
+        self.assertIs(paso.title, paso.title)
+
+
+class TestMatrixTableModel(unittest.TestCase):
+    def _editar(self, modelo, fila, columna, texto):
+        return modelo.setData(modelo.index(fila, columna), texto, Qt.EditRole)
+
+    def test_resize_conserva_celdas_comunes(self):
+        modelo = MatrixTableModel(2, 2, ("x1", "x2"))
+        self._editar(modelo, 0, 0, "3/4")
+        self._editar(modelo, 1, 1, "5")
+        modelo.resize(3, 1, ("x1",))
+        self.assertEqual((modelo.rowCount(), modelo.columnCount()), (3, 1))
+        self.assertEqual(modelo.to_matrix(), [[Fraction(3, 4)], [Fraction(0)], [Fraction(0)]])
+        self.assertEqual(modelo.headerData(0, Qt.Horizontal), "x1")
+        modelo.resize(3, 2, ("x1", "x2"))
+        self.assertEqual(modelo.cell_text(0, 0), "3/4")
+        self.assertEqual(modelo.cell_text(1, 1), "0")
+
+    def test_set_data_normaliza_texto(self):
+        modelo = MatrixTableModel(1, 2)
+        self.assertTrue(self._editar(modelo, 0, 0, "  2.5 "))
+        self.assertTrue(self._editar(modelo, 0, 1, "   "))
+        self.assertEqual(modelo.cell_text(0, 0), "2.5")
+        self.assertEqual(modelo.cell_text(0, 1), "0")
+        self.assertEqual(modelo.to_matrix(), [[Fraction(5, 2), Fraction(0)]])
+
+    def test_to_matrix_indica_primera_celda_invalida(self):
+        modelo = MatrixTableModel(2, 2)
+        self._editar(modelo, 1, 0, "abc")
+        self._editar(modelo, 1, 1, "xyz")
+        with self.assertRaises(ValueError) as ctx:
+            modelo.to_matrix()
+        self.assertIn("fila 2, columna 1: 'abc'", str(ctx.exception))
+
+    def test_fill_y_set_cells_actualizan_valores(self):
+        modelo = MatrixTableModel(2, 2)
+        modelo.set_cells([["1", "1/3"], ["-2", "0.5"]])
+        self.assertEqual(
+            modelo.to_matrix(),
+            [[Fraction(1), Fraction(1, 3)], [Fraction(-2), Fraction(1, 2)]],
+        )
+        modelo.fill("7")
+        self.assertEqual(modelo.cell_text(1, 1), "7")
+        self.assertEqual(modelo.to_matrix(), [[Fraction(7)] * 2] * 2)
+        modelo.fill()
+        self.assertEqual(modelo.to_matrix(), [[Fraction(0)] * 2] * 2)
+
+
+class TestResultCache(unittest.TestCase):
+    def test_matrix_key_con_fracciones(self):
+        clave = matrix_key([[Fraction(1, 2), Fraction(3)], [Fraction(0), Fraction(-1)]])
+        self.assertEqual(clave, ((Fraction(1, 2), Fraction(3)), (Fraction(0), Fraction(-1))))
+        # Fracciones equivalentes producen la misma clave.
+        self.assertEqual(hash(clave), hash(matrix_key([[Fraction(2, 4), 3], [0, -1]])))
+        cache = ResultCache()
+        cache.put(clave, "resultado")
+        self.assertEqual(cache.get(matrix_key([[Fraction(2, 4), Fraction(6, 2)], [0, -1]])), "resultado")
+        self.assertIsNone(cache.get(matrix_key([[Fraction(1, 3), 3], [0, -1]])))
+
+    def test_expulsa_la_entrada_menos_usada(self):
+        cache = ResultCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "a" pasa a ser la más reciente
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        cache.put("a", 10)  # reescribir también renueva la entrada
+        cache.put("d", 4)
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual(cache.get("a"), 10)
+
+
 if __name__ == "__main__":
     unittest.main()